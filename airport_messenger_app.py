@@ -1,171 +1,12 @@
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
-from dataclasses import dataclass, asdict
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 
-# ------------------------------
-# Domain: rules + templates
-# ------------------------------
-RULES = {
-    "forbidden": ["panic", "blame", "speculation", "jargon for passengers: METAR, TAF, NOTAM"],
-    "event_types": {
-        "weather": {
-            "phrases": {
-                "passenger": [
-                    "due to adverse weather",
-                    "your safety is our priority",
-                    "we appreciate your patience",
-                ],
-                "pilot": [
-                    "expect delay due to weather in departure/arrival sector",
-                    "monitor ATC advisory",
-                ],
-                "staff": [
-                    "coordinate gate and crew availability",
-                    "update displays and inform gate agents",
-                ],
-            }
-        },
-        "runway": {
-            "phrases": {
-                "passenger": ["runway availability constraints"],
-                "pilot": ["runway closure/restriction in effect"],
-                "staff": ["redirect ground operations"],
-            }
-        },
-        "technical": {
-            "phrases": {
-                "passenger": ["aircraft requires a technical inspection", "for your safety"],
-                "pilot": ["maintenance in progress; stand by for new ETD"],
-                "staff": ["dispatch maintenance team and prepare equipment"],
-            }
-        },
-    },
-}
-
-SEVERITIES = ["low", "medium", "high", "critical"]
-EVENT_TYPES = list(RULES["event_types"].keys())
-
-def _safe(lst: List[str], idx: int, default: str = "") -> str:
-    try:
-        return lst[idx]
-    except Exception:
-        return default
-
-def generate_messages(event: Dict[str, Any]) -> Dict[str, str]:
-    """
-    Deterministic, template-based messages (no API keys needed).
-    """
-    etype = event.get("event_type", "")
-    phrases = RULES["event_types"].get(etype, {}).get("phrases", {})
-    passenger_p = phrases.get("passenger", [])
-    pilot_p = phrases.get("pilot", [])
-    staff_p = phrases.get("staff", [])
-
-    flight_no = event.get("flight_no") or "N/A"
-    dest = event.get("destination") or "your destination"
-    gate = event.get("gate") or "the assigned gate"
-    runway = event.get("runway") or "TBD"
-    severity = event.get("severity") or "medium"
-    eta = event.get("eta_change_minutes")
-    eta_str = f"{eta} minutes" if eta else "TBD"
-    notes = event.get("notes") or "N/A"
-
-    passenger_msg = (
-        f"Attention passengers: {_safe(passenger_p, 0, 'an operational delay')} "
-        f"affecting flight {flight_no} to {dest}. "
-        f"Estimated delay: {eta_str}. "
-        f"{_safe(passenger_p, 1)}. {_safe(passenger_p, 2)} "
-        f"Please remain near gate {gate} for updates. Thank you for your understanding."
-    ).strip()
-
-    pilot_msg = (
-        f"{_safe(pilot_p, 0, 'operational delay in effect')} for {flight_no}. "
-        f"Severity: {severity}. {_safe(pilot_p, 1)} "
-        f"Runway: {runway}. Gate: {gate}. ETA change: {eta_str}. "
-        f"Notes: {notes}."
-    ).strip()
-
-    staff_msg = (
-        f"Action required: event={etype}, severity={severity} for flight {flight_no}. "
-        f"- Gate: {gate}, Runway: {runway}, ETA change: {eta_str}. "
-        f"- Tasks: {_safe(staff_p, 0, 'coordinate impacted teams')}, "
-        f"{_safe(staff_p, 1, 'notify affected parties')}. "
-        f"- Comms: update FIDS, inform AOCC, and document actions in the log."
-    ).strip()
-
-    outputs = {}
-    for a in event.get("audiences", ["passenger", "pilot", "staff"]):
-        if a == "passenger":
-            outputs[a] = passenger_msg
-        elif a == "pilot":
-            outputs[a] = pilot_msg
-        elif a == "staff":
-            outputs[a] = staff_msg
-    return outputs
-
-# ------------------------------
-# UI Helpers
-# ------------------------------
-def splitflap_animate(widget: tk.Text, text: str, delay_ms: int = 12):
-    """
-    Cute split-flap style: reveal text char-by-char, with slight stutter on spaces.
-    """
-    widget.configure(state="normal")
-    widget.delete("1.0", tk.END)
-    current = []
-
-    def step(i: int):
-        if i > len(text):
-            widget.configure(state="disabled")
-            return
-        current_text = text[:i]
-        widget.delete("1.0", tk.END)
-        widget.insert(tk.END, current_text)
-        widget.see(tk.END)
-        # Slightly longer pause on whitespace for a 'flip' vibe
-        ch = text[i - 1] if i > 0 else ""
-        pause = delay_ms * (3 if ch in [" ", "\n", "\t"] else 1)
-        widget.after(pause, lambda: step(i + 1))
+from messages import EVENT_TYPES, SEVERITIES, clear_message_cache, generate_messages
 
-    step(0)
-
-@dataclass
-class EventForm:
-    event_type: str
-    severity: str
-    flight_no: str
-    origin: str
-    destination: str
-    eta_change_minutes: int
-    gate: str
-    runway: str
-    notes: str
-    audience_passenger: bool
-    audience_pilot: bool
-    audience_staff: bool
-
-    def to_event(self) -> Dict[str, Any]:
-        audiences = []
-        if self.audience_passenger:
-            audiences.append("passenger")
-        if self.audience_pilot:
-            audiences.append("pilot")
-        if self.audience_staff:
-            audiences.append("staff")
-        return {
-            "event_type": self.event_type,
-            "severity": self.severity,
-            "flight_no": self.flight_no or None,
-            "origin": self.origin or None,
-            "destination": self.destination or None,
-            "eta_change_minutes": int(self.eta_change_minutes) if str(self.eta_change_minutes).strip() else 0,
-            "gate": self.gate or None,
-            "runway": self.runway or None,
-            "language": "en",
-            "audiences": audiences or ["passenger", "pilot", "staff"],
-            "notes": self.notes or None,
-        }
+# Characters that get the longer split-flap pause
+_WS = frozenset(" \n\t")
 
 # ------------------------------
 # Tkinter App
@@ -213,25 +54,34 @@ class AirportApp(tk.Tk):
             widget.grid(row=row, column=1, sticky="we", pady=3, padx=(6,0))
             parent.grid_columnconfigure(1, weight=1)
 
-        self.event_type = tk.StringVar(value=EVENT_TYPES[0])
-        self.severity = tk.StringVar(value="medium")
-        self.flight_no = tk.StringVar(value="AI-320")
-        self.origin = tk.StringVar(value="DEL")
-        self.destination = tk.StringVar(value="BOM")
-        self.eta_change = tk.StringVar(value="45")
-        self.gate = tk.StringVar(value="A7")
-        self.runway = tk.StringVar(value="09R")
-        self.notes = tk.StringVar(value="Thunderstorm cells near departure path")
+        def entry(value):
+            widget = ttk.Entry(left)
+            widget.insert(0, value)
+            return widget
+
+        def combo(values, value):
+            widget = ttk.Combobox(left, values=values, state="readonly")
+            widget.set(value)
+            return widget
+
+        # Nothing traces these fields, so _build_event reads the widgets directly;
+        # keys are the event dict keys
+        self._fields = {
+            "event_type": combo(EVENT_TYPES, EVENT_TYPES[0]),
+            "severity": combo(SEVERITIES, "medium"),
+            "flight_no": entry("AI-320"),
+            "origin": entry("DEL"),
+            "destination": entry("BOM"),
+            "eta_change_minutes": entry("45"),
+            "gate": entry("A7"),
+            "runway": entry("09R"),
+            "notes": entry("Thunderstorm cells near departure path"),
+        }
 
-        labeled(left, "Event Type", 0, ttk.Combobox(left, textvariable=self.event_type, values=EVENT_TYPES, state="readonly"))
-        labeled(left, "Severity", 1, ttk.Combobox(left, textvariable=self.severity, values=SEVERITIES, state="readonly"))
-        labeled(left, "Flight No", 2, ttk.Entry(left, textvariable=self.flight_no))
-        labeled(left, "Origin", 3, ttk.Entry(left, textvariable=self.origin))
-        labeled(left, "Destination", 4, ttk.Entry(left, textvariable=self.destination))
-        labeled(left, "ETA Change (min)", 5, ttk.Entry(left, textvariable=self.eta_change))
-        labeled(left, "Gate", 6, ttk.Entry(left, textvariable=self.gate))
-        labeled(left, "Runway", 7, ttk.Entry(left, textvariable=self.runway))
-        labeled(left, "Notes", 8, ttk.Entry(left, textvariable=self.notes))
+        labels = ["Event Type", "Severity", "Flight No", "Origin", "Destination",
+                  "ETA Change (min)", "Gate", "Runway", "Notes"]
+        for row, (text, widget) in enumerate(zip(labels, self._fields.values())):
+            labeled(left, text, row, widget)
 
         # Audiences + behavior toggles
         self.aud_passenger = tk.BooleanVar(value=True)
@@ -255,69 +105,143 @@ class AirportApp(tk.Tk):
         ttk.Button(btns, text="Generate", command=self.on_generate).pack(side="left")
         ttk.Button(btns, text="Clear", command=self.on_clear).pack(side="left", padx=6)
 
-        # Right column: outputs (glass cards)
-        def output_panel(parent, title):
-            frame = tk.Frame(parent, bg="#0b1220", highlightbackground="#334155", highlightthickness=1)
-            frame.pack(fill="both", expand=True, pady=8)
-            lbl = tk.Label(frame, text=title, bg="#0b1220", fg="#93c5fd", font=("Segoe UI", 12, "bold"))
-            lbl.pack(anchor="w", padx=8, pady=(6,2))
-            txt = tk.Text(frame, wrap="word", height=8, bg="#0f172a", fg="#e6edf3", bd=0, insertbackground="#e6edf3")
-            txt.pack(fill="both", expand=True, padx=8, pady=8)
-            txt.configure(state="disabled")
-            return txt
-
-        self.out_passenger = output_panel(right, "Passenger Message")
-        self.out_pilot = output_panel(right, "Pilot Message")
-        self.out_staff = output_panel(right, "Staff Message")
+        # Right column: outputs (one glass card, a tagged region per audience)
+        frame = tk.Frame(right, bg="#0b1220", highlightbackground="#334155", highlightthickness=1)
+        frame.pack(fill="both", expand=True, pady=8)
+        self.out = tk.Text(frame, wrap="word", height=26, bg="#0f172a", fg="#e6edf3", bd=0,
+                           insertbackground="#e6edf3", padx=8, pady=8)
+        self.out.pack(fill="both", expand=True, padx=8, pady=8)
+        self.out.tag_configure("heading", foreground="#93c5fd", font=("Segoe UI", 12, "bold"),
+                               spacing1=6, spacing3=4)
+
+        # Each message lives between <audience>_start and <audience>_end. Both
+        # marks sit still while the layout is built; afterwards the end mark
+        # gets right gravity so text written into the region stays inside it.
+        titles = {"passenger": "Passenger Message", "pilot": "Pilot Message", "staff": "Staff Message"}
+        self._regions = tuple(titles)
+        for region, title in titles.items():
+            if region != self._regions[0]:
+                self.out.insert(tk.END, "\n\n")
+            self.out.insert(tk.END, title + "\n", "heading")
+            self.out.tag_configure(region, lmargin1=2, lmargin2=2)
+            for mark in (f"{region}_start", f"{region}_end"):
+                self.out.mark_set(mark, "end-1c")
+                self.out.mark_gravity(mark, "left")
+        for region in self._regions:
+            self.out.mark_gravity(f"{region}_end", "right")
+        self.out.configure(state="disabled")
+        self._anim_job = None
 
         # Footer
         footer = tk.Label(self, text="B+C UI — Airport board vibe + modern dashboard • © You, crushing it",
                           bg="#0b1220", fg="#64748b")
         footer.pack(pady=(2, 10))
 
-    def form_data(self) -> EventForm:
-        return EventForm(
-            event_type=self.event_type.get(),
-            severity=self.severity.get(),
-            flight_no=self.flight_no.get(),
-            origin=self.origin.get(),
-            destination=self.destination.get(),
-            eta_change_minutes=int(self.eta_change.get() or 0),
-            gate=self.gate.get(),
-            runway=self.runway.get(),
-            notes=self.notes.get(),
-            audience_passenger=self.aud_passenger.get(),
-            audience_pilot=self.aud_pilot.get(),
-            audience_staff=self.aud_staff.get(),
-        )
+    def _build_event(self) -> Dict[str, Any]:
+        vals = {k: w.get() for k, w in self._fields.items()}
+        audiences = [name for name, var in (("passenger", self.aud_passenger),
+                                            ("pilot", self.aud_pilot),
+                                            ("staff", self.aud_staff)) if var.get()]
+        return {
+            "event_type": vals["event_type"],
+            "severity": vals["severity"],
+            "flight_no": vals["flight_no"] or None,
+            "origin": vals["origin"] or None,
+            "destination": vals["destination"] or None,
+            "eta_change_minutes": int(vals["eta_change_minutes"] or 0),
+            "gate": vals["gate"] or None,
+            "runway": vals["runway"] or None,
+            "language": "en",
+            "audiences": audiences or ["passenger", "pilot", "staff"],
+            "notes": vals["notes"] or None,
+        }
 
     def on_generate(self):
-        event = self.form_data().to_event()
+        event = self._build_event()
         try:
             msgs = generate_messages(event)
         except Exception as e:
             messagebox.showerror("Error", str(e))
             return
 
+        delay_ms = 10 if self.instant_mode.get() else 25
+        outputs = [(region, msgs.get(region, "")) for region in self._regions]
+
         # Fill outputs
-        def set_text(widget: tk.Text, text: str):
-            if self.animated_mode.get():
-                splitflap_animate(widget, text, delay_ms=10 if self.instant_mode.get() else 25)
+        if self.animated_mode.get():
+            self._animate_multi(outputs, delay_ms=delay_ms)
+            return
+
+        self._cancel_animation()
+        self.out.configure(state="normal")
+        for region, text in outputs:
+            self.out.replace(f"{region}_start", f"{region}_end", text, region)
+        self.out.configure(state="disabled")
+
+    def _cancel_animation(self):
+        if self._anim_job is not None:
+            self.after_cancel(self._anim_job)
+            self._anim_job = None
+
+    def _animate_multi(self, pairs: List[Tuple[str, str]], delay_ms: int = 12):
+        """
+        Cute split-flap style: reveal text char-by-char, with slight stutter on spaces.
+        All regions of the output share a single timer, so each tick is one event-loop
+        wakeup. Each region is pre-filled with blanks that are overwritten in place, so
+        the wrapped layout stays put while characters flip in.
+        """
+        self._cancel_animation()
+        out = self.out
+        out.configure(state="normal")
+        active = []
+        for region, text in pairs:
+            start, anim = f"{region}_start", f"{region}_anim"
+            out.replace(start, f"{region}_end", " " * len(text), region)
+            out.mark_set(anim, start)
+            out.mark_gravity(anim, "left")
+            active.append([anim, region, text, 0, 1.0])  # mark, tag, text, next index, due (in ticks)
+        started = time.perf_counter()
+
+        def tick():
+            # Emit whatever is due by now, so a late timer catches up in one write
+            now = (time.perf_counter() - started) * 1000 / delay_ms
+            running = []
+            last_written = None
+            for entry in active:
+                anim, region, text, idx, due = entry
+                end = idx
+                while end < len(text) and due <= now:
+                    # Slightly longer pause on whitespace for a 'flip' vibe
+                    due += 3 if text[end] in _WS else 1
+                    end += 1
+                if end > idx:
+                    step = f"{anim}+{end - idx}c"
+                    out.replace(anim, step, text[idx:end], region)
+                    out.mark_set(anim, step)
+                    entry[3], entry[4] = end, due
+                    last_written = anim
+                if end < len(text):
+                    running.append(entry)
+            # Keep the most recently written region in view, like the per-widget
+            # reveal did, so a region below the fold doesn't flip in off-screen
+            if last_written is not None:
+                out.see(last_written)
+            active[:] = running
+            if active:
+                self._anim_job = self.after(delay_ms, tick)
             else:
-                widget.configure(state="normal")
-                widget.delete("1.0", tk.END)
-                widget.insert(tk.END, text)
-                widget.configure(state="disabled")
+                self._anim_job = None
+                out.configure(state="disabled")
 
-        set_text(self.out_passenger, msgs.get("passenger", ""))
-        set_text(self.out_pilot, msgs.get("pilot", ""))
-        set_text(self.out_staff, msgs.get("staff", ""))
+        self._anim_job = self.after(delay_ms, tick)
 
     def on_clear(self):
-        for t in (self.out_passenger, self.out_pilot, self.out_staff):
-            t.configure(state="normal")
-            t.delete("1.0", tk.END)
-            t.configure(state="disabled")
+        self._cancel_animation()
+        clear_message_cache()
+        self.out.configure(state="normal")
+        for region in self._regions:
+            self.out.delete(f"{region}_start", f"{region}_end")
+        self.out.configure(state="disabled")
 
 if __name__ == "__main__":
     app = AirportApp()
@@ -0,0 +1,212 @@
+import functools
+import string
+from typing import Callable, Dict, Any, FrozenSet, List, Mapping, Optional, Set, Tuple
+
+# ------------------------------
+# Domain: rules + templates
+# ------------------------------
+RULES: Dict[str, Any] = {
+    "forbidden": ["panic", "blame", "speculation", "jargon for passengers: METAR, TAF, NOTAM"],
+    "event_types": {
+        "weather": {
+            "phrases": {
+                "passenger": [
+                    "due to adverse weather",
+                    "your safety is our priority",
+                    "we appreciate your patience",
+                ],
+                "pilot": [
+                    "expect delay due to weather in departure/arrival sector",
+                    "monitor ATC advisory",
+                ],
+                "staff": [
+                    "coordinate gate and crew availability",
+                    "update displays and inform gate agents",
+                ],
+            }
+        },
+        "runway": {
+            "phrases": {
+                "passenger": ["runway availability constraints"],
+                "pilot": ["runway closure/restriction in effect"],
+                "staff": ["redirect ground operations"],
+            }
+        },
+        "technical": {
+            "phrases": {
+                "passenger": ["aircraft requires a technical inspection", "for your safety"],
+                "pilot": ["maintenance in progress; stand by for new ETD"],
+                "staff": ["dispatch maintenance team and prepare equipment"],
+            }
+        },
+    },
+}
+
+SEVERITIES: List[str] = ["low", "medium", "high", "critical"]
+EVENT_TYPES: List[str] = list(RULES["event_types"].keys())
+
+# Message bodies, in str.format syntax; compiled into render functions below.
+PASSENGER_TMPL: str = (
+    "Attention passengers: {passenger[0]} "
+    "affecting flight {flight_no} to {dest}. "
+    "Estimated delay: {eta_str}. "
+    "{passenger[1]}. {passenger[2]} "
+    "Please remain near gate {gate} for updates. Thank you for your understanding."
+)
+
+PILOT_TMPL: str = (
+    "{pilot[0]} for {flight_no}. "
+    "Severity: {severity}. {pilot[1]} "
+    "Runway: {runway}. Gate: {gate}. ETA change: {eta_str}. "
+    "Notes: {notes}."
+)
+
+STAFF_TMPL: str = (
+    "Action required: event={etype}, severity={severity} for flight {flight_no}. "
+    "- Gate: {gate}, Runway: {runway}, ETA change: {eta_str}. "
+    "- Tasks: {staff[0]}, "
+    "{staff[1]}. "
+    "- Comms: update FIDS, inform AOCC, and document actions in the log."
+)
+
+# Audience -> template, in the order messages are returned.
+TEMPLATES: Dict[str, str] = {
+    "passenger": PASSENGER_TMPL,
+    "pilot": PILOT_TMPL,
+    "staff": STAFF_TMPL,
+}
+
+Renderer = Callable[[Mapping[str, Any]], Dict[str, str]]
+
+def _fstring_source(template: str) -> Tuple[str, Set[str]]:
+    """
+    Translate a format template into f-string source, plus the context names it reads.
+    Fields may be plain names or integer-indexed names.
+    """
+    parts: List[str] = []
+    names: Set[str] = set()
+    for literal, field, spec, conv in string.Formatter().parse(template):
+        if literal:
+            parts.append("f" + repr(literal.replace("{", "{{").replace("}", "}}")))
+        if field is None:
+            continue
+        name, _, index = field.partition("[")
+        if not name.isidentifier() or (index and not index.rstrip("]").isdigit()):
+            raise ValueError(f"Unsupported template field: {field!r}")
+        names.add(name)
+        expr = field + (f"!{conv}" if conv else "") + (f":{spec}" if spec else "")
+        parts.append("f'{" + expr + "}'")
+    # Adjacent f-string literals compile to a single BUILD_STRING, which sizes the
+    # result once and copies each fragment in: str.join's one allocation, minus the list
+    return " ".join(parts) or repr(""), names
+
+def _compile_renderer(audiences: FrozenSet[str]) -> Renderer:
+    """
+    Generate a render function for exactly these audiences, so rendering does no
+    template parsing and no per-audience branching at run time.
+    """
+    names: Set[str] = set()
+    entries: List[str] = []
+    for audience, template in TEMPLATES.items():
+        if audience in audiences:
+            expr, used = _fstring_source(template)
+            names |= used
+            entries.append(f"        {audience!r}: {expr},\n")
+    src = "def render(ctx):\n"
+    src += "".join(f"    {n} = ctx[{n!r}]\n" for n in sorted(names))
+    src += "    return {\n" + "".join(entries) + "    }\n"
+    namespace: Dict[str, Any] = {}
+    exec(src, namespace)
+    render: Renderer = namespace["render"]
+    return render
+
+# One generated renderer per audience subset, built on first use.
+_RENDER_CACHE: Dict[FrozenSet[str], Renderer] = {}
+
+def _renderer_for(audiences: FrozenSet[str]) -> Renderer:
+    render = _RENDER_CACHE.get(audiences)
+    if render is None:
+        render = _RENDER_CACHE[audiences] = _compile_renderer(audiences)
+    return render
+
+# Fallbacks for phrase slots an event type does not define; other slots render empty.
+PHRASE_DEFAULTS: Dict[str, Tuple[str, ...]] = {
+    "passenger": ("an operational delay", "", ""),
+    "pilot": ("operational delay in effect", "", ""),
+    "staff": ("coordinate impacted teams", "notify affected parties", ""),
+}
+
+def _pad(phrases: List[str], defaults: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Fill the phrase slots up to a fixed length, so templates can index them directly.
+    """
+    return tuple(phrases[:3]) + defaults[len(phrases):]
+
+# (passenger, pilot, staff) phrase slots per event type, flattened out of RULES once.
+PHRASES_BY_EVENT: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    etype: tuple(
+        _pad(spec["phrases"].get(audience, []), PHRASE_DEFAULTS[audience])
+        for audience in ("passenger", "pilot", "staff")
+    )
+    for etype, spec in RULES["event_types"].items()
+}
+_EMPTY_TRIPLE: Tuple[Tuple[str, ...], ...] = (
+    PHRASE_DEFAULTS["passenger"], PHRASE_DEFAULTS["pilot"], PHRASE_DEFAULTS["staff"],
+)
+
+# (event_type, severity, flight_no, destination, gate, runway, eta_change_minutes, notes, audiences)
+EventKey = Tuple[str, Optional[str], Optional[str], Optional[str], Optional[str],
+                 Optional[str], Optional[int], Optional[str], FrozenSet[str]]
+
+def generate_messages(event: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Deterministic, template-based messages (no API keys needed).
+    Results are memoised on the event fields that end up in the text.
+    Missing or empty audiences mean all of them.
+    """
+    key: EventKey = (
+        event.get("event_type", ""),
+        event.get("severity"),
+        event.get("flight_no"),
+        event.get("destination"),
+        event.get("gate"),
+        event.get("runway"),
+        event.get("eta_change_minutes"),
+        event.get("notes"),
+        frozenset(event.get("audiences") or TEMPLATES).intersection(TEMPLATES),
+    )
+    # Copy so callers can't mutate the cached result
+    return dict(_generate_messages_cached(key))
+
+def clear_message_cache() -> None:
+    _generate_messages_cached.cache_clear()
+
+@functools.lru_cache(maxsize=64)
+def _generate_messages_cached(key: EventKey) -> Dict[str, str]:
+    etype: str = key[0]
+    severity: Optional[str] = key[1]
+    flight_no: Optional[str] = key[2]
+    dest: Optional[str] = key[3]
+    gate: Optional[str] = key[4]
+    runway: Optional[str] = key[5]
+    eta: Optional[int] = key[6]
+    notes: Optional[str] = key[7]
+    aud: FrozenSet[str] = key[8]
+
+    phrases: Tuple[Tuple[str, ...], ...] = PHRASES_BY_EVENT.get(etype, _EMPTY_TRIPLE)
+    ctx: Dict[str, Any] = {
+        "etype": etype,
+        "flight_no": flight_no if flight_no else "N/A",
+        "dest": dest if dest else "your destination",
+        "gate": gate if gate else "the assigned gate",
+        "runway": runway if runway else "TBD",
+        "severity": severity if severity else "medium",
+        "eta_str": f"{eta} minutes" if eta else "TBD",
+        "notes": notes if notes else "N/A",
+        "passenger": phrases[0],
+        "pilot": phrases[1],
+        "staff": phrases[2],
+    }
+
+    # Only the requested audiences are rendered
+    return _renderer_for(aud)(ctx)